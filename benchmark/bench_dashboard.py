@@ -0,0 +1,228 @@
+"""Benchmark tahapan dashboard pada data asli dan data sintetis yang dibesarkan.
+
+Setiap skala dijalankan di proses terpisah dengan BIKE_DATA_DIR/BIKE_CACHE_DIR
+menunjuk ke data sintetisnya, lalu setiap tahap (load CSV, parsing tanggal,
+ETL, load cube, dataset bersama, filter, setiap groupby, scan dengan pushdown
+dan setiap render grafik) diukur. Hasil ditulis sebagai JSON agar bisa
+dibandingkan antar commit.
+
+Jalankan:
+    python benchmark/bench_dashboard.py --scales 1 10 100 1000
+    python benchmark/bench_dashboard.py --scales 10 --compare benchmark/results/abc1234.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+DASHBOARD_DIR = os.path.join(ROOT_DIR, "dashboard")
+WORK_DIR = os.path.join(BENCH_DIR, ".data")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def timed(results, name, fn, repeat=1):
+    """Jalankan `fn` sebanyak `repeat` kali, simpan min/median detik, kembalikan hasil terakhir."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        durations.append(time.perf_counter() - start)
+    results[name] = {"min": min(durations), "median": statistics.median(durations), "runs": repeat}
+    return value
+
+
+def run_stages(repeat, app):
+    """Ukur setiap tahap dashboard pada data di BIKE_DATA_DIR. Dijalankan di proses worker."""
+    sys.path.insert(0, DASHBOARD_DIR)
+
+    import pandas as pd
+
+    import charts
+    import cube as cube_ops
+    import data_store
+    import query
+    import render
+    import schema
+    from shared import SharedDataset
+
+    stages = {}
+    hour_raw = timed(stages, "load_csv", lambda: pd.read_csv(data_store.HOUR_CSV), repeat)
+    timed(stages, "date_parse", lambda: pd.to_datetime(hour_raw["dteday"]), repeat)
+    rows = len(hour_raw)
+    del hour_raw
+
+    shutil.rmtree(data_store.CACHE_DIR, ignore_errors=True)
+    timed(stages, "etl", data_store.ensure_hourly_store)
+
+    # Tahap berikut mengikuti urutan yang dijalankan dashboard.py
+    cube = timed(stages, "cube_load", data_store.load_cube, repeat)
+    shared = timed(stages, "shared_build", lambda: SharedDataset(cube), repeat)
+
+    # Filter yang mewakili pemakaian: separuh rentang tanggal, musim panas/gugur, cuaca cerah/berawan
+    first, last = shared.date_range
+    start = first + (last - first) / 4
+    end = last - (last - first) / 4
+    selection = (start, end, [2, 3], [0, 1], [1, 2])
+
+    index = timed(stages, "shared_select", lambda: shared.select(*selection), repeat)
+    daily = timed(stages, "shared_daily_totals", lambda: shared.daily_totals(index), repeat)
+    averages = {
+        key: timed(stages, f"groupby_{key}", lambda key=key: cube_ops.average_per_day(daily, key), repeat)
+        for key in charts.AVERAGE_CHARTS
+    }
+    trend = timed(stages, "shared_monthly", lambda: shared.monthly_trend(index), repeat)
+    waktu = timed(stages, "shared_time_of_day", lambda: shared.average_per_hour(schema.TIME_OF_DAY), repeat)
+    df_harian = timed(
+        stages,
+        "query_scan_daily",
+        lambda: query.scan_days(["dteday_x", "temp_x", "hum_x", "cnt_x"], *selection),
+        repeat,
+    )
+
+    figures = {
+        "render_season": (charts.plot_average_bar, averages["season_x"], "season_x"),
+        "render_workingday": (charts.plot_average_bar, averages["workingday_x"], "workingday_x"),
+        "render_weather": (charts.plot_average_bar, averages["weathersit_x"], "weathersit_x"),
+        "render_monthly_trend": (charts.plot_monthly_trend, trend),
+        "render_correlation": (charts.plot_correlation_panel, df_harian),
+        "render_time_of_day": (charts.plot_time_of_day, waktu),
+    }
+    for name, job in figures.items():
+        timed(stages, name, lambda job=job: render.render_png(*job), repeat)
+
+    # Semua grafik lewat ChartRenderer: cold = render paralel, warm = semua dari cache
+    def render_cold():
+        renderer = render.ChartRenderer()
+        try:
+            return renderer.render_all(figures)
+        finally:
+            renderer.close()
+
+    timed(stages, "render_all_cold", render_cold, repeat)
+    renderer = render.ChartRenderer()
+    renderer.render_all(figures)
+    timed(stages, "render_all_warm", lambda: renderer.render_all(figures), repeat)
+    renderer.close()
+
+    if app:
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(os.path.join(DASHBOARD_DIR, "dashboard.py"), default_timeout=600)
+        timed(stages, "app_cold", at.run)
+        timed(stages, "app_rerun", at.run, repeat)
+        if at.exception:
+            raise RuntimeError(f"dashboard gagal dijalankan: {at.exception[0].value}")
+
+    return {
+        "rows": rows,
+        "days": len(shared),
+        "cube_rows": len(cube),
+        "cube_mb": float(cube.memory_usage(deep=True).sum() / 1e6),
+        "stages": stages,
+    }
+
+
+def prepare_scale(scale, seed):
+    """Direktori data dan cache untuk satu skala; data sintetis dibuat jika belum ada."""
+    from synthetic import GENERATOR_VERSION, SOURCE_DIR, generate
+
+    scale_dir = os.path.join(WORK_DIR, f"scale-{scale}")
+    if scale == 1:
+        data_dir = SOURCE_DIR
+    else:
+        data_dir = scale_dir
+        marker = os.path.join(scale_dir, f".v{GENERATOR_VERSION}-seed-{seed}")
+        if not os.path.exists(marker):
+            print(f"membuat data sintetis {scale}x ...", file=sys.stderr)
+            generate(scale, scale_dir, seed=seed)
+            open(marker, "w").close()
+    return data_dir, os.path.join(scale_dir, "cache")
+
+
+def run_scale(scale, seed, repeat, app):
+    data_dir, cache_dir = prepare_scale(scale, seed)
+    env = dict(os.environ, BIKE_DATA_DIR=data_dir, BIKE_CACHE_DIR=cache_dir)
+    command = [sys.executable, os.path.abspath(__file__), "--worker", "--repeat", str(repeat)]
+    if not app:
+        command.append("--skip-app")
+    out = subprocess.run(command, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"benchmark skala {scale} gagal:\n{out.stderr}")
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def compare(current, baseline_path):
+    """Cetak rasio waktu (median) terhadap hasil benchmark sebelumnya."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nperbandingan dengan {baseline['commit']} (rasio > 1 berarti lebih lambat):")
+    for scale, result in current["scales"].items():
+        old = baseline["scales"].get(scale)
+        if old is None:
+            continue
+        for name, stage in result["stages"].items():
+            if name in old["stages"]:
+                ratio = stage["median"] / max(old["stages"][name]["median"], 1e-9)
+                print(f"  {scale:>5}x {name:<24} {ratio:6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tahapan dashboard pada berbagai skala data.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000], help="kelipatan data asli")
+    parser.add_argument("--repeat", type=int, default=3, help="pengulangan per tahap")
+    parser.add_argument("--seed", type=int, default=0, help="seed data sintetis")
+    parser.add_argument("--output", help="file JSON hasil (default benchmark/results/<commit>.json)")
+    parser.add_argument("--compare", help="file JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--skip-app", action="store_true", help="lewati run penuh dashboard lewat AppTest")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        # Worker menghapus CACHE_DIR; jangan pernah sampai ke cache dashboard yang asli
+        if not os.environ.get("BIKE_CACHE_DIR"):
+            parser.error("--worker hanya dijalankan lewat run_scale (BIKE_CACHE_DIR harus diset)")
+        print(json.dumps(run_stages(args.repeat, not args.skip_app)))
+        return
+
+    commit = git_commit()
+    result = {
+        "commit": commit,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scales": {},
+    }
+    for scale in args.scales:
+        print(f"benchmark skala {scale}x ...", file=sys.stderr)
+        result["scales"][str(scale)] = run_scale(scale, args.seed, args.repeat, not args.skip_app)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"hasil ditulis ke {output}")
+
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
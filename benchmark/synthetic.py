@@ -0,0 +1,112 @@
+"""Generator data sintetis day.csv/hour.csv untuk benchmark dashboard.
+
+Data dibesarkan dalam `scale` blok yang masing-masing berukuran data asli.
+Blok pertama mengisi salinan kalender: setiap salinan adalah dua tahun data asli
+yang digeser 2, 4, 6, ... tahun ke depan (maksimal MAX_CALENDAR_COPIES salinan,
+dibatasi rentang kolom `yr` int8), sehingga jumlah tanggal, baris day.csv dan
+kunci cube ikut tumbuh. Jika `scale` lebih besar, blok sisanya menjadi stasiun
+tambahan pada kalender yang sama. Setiap blok memakai musim, cuaca dan jam yang
+sama dengan data asli (jadi distribusinya tetap), dengan jumlah penyewaan yang
+dikali faktor stasiun dan noise per baris. day.csv berisi satu baris per
+tanggal dengan casual/registered/cnt berupa total seluruh stasiun, sehingga
+join per `dteday` tetap valid. Tanggal 29 Februari yang jatuh di tahun bukan
+kabisat dibuang.
+
+Jalankan: python benchmark/synthetic.py --scale 10 --output benchmark/.data/scale-10
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT_DIR, "data", "Bike-sharing-dataset")
+COUNT_COLUMNS = ["casual", "registered", "cnt"]
+# Naikkan jika data yang dihasilkan berubah agar data benchmark lama dibuat ulang
+GENERATOR_VERSION = 2
+# 50 salinan x 2 tahun: 2011-2110, yr tetap muat di int8
+MAX_CALENDAR_COPIES = 50
+
+
+def _station_counts(hour_df, rng):
+    # Faktor ukuran stasiun (lognormal) dan noise per baris, dibulatkan ke bilangan bulat
+    factor = rng.lognormal(mean=0.0, sigma=0.3)
+    noise = rng.lognormal(mean=0.0, sigma=0.1, size=(len(hour_df), 2))
+    casual = np.rint(hour_df["casual"].to_numpy() * factor * noise[:, 0]).astype(np.int64)
+    registered = np.rint(hour_df["registered"].to_numpy() * factor * noise[:, 1]).astype(np.int64)
+    return casual, registered
+
+
+def shift_calendar(df, copy):
+    """Geser tanggal `df` sejauh 2*`copy` tahun; yr/weekday/workingday disesuaikan."""
+    dates = pd.to_datetime(df["dteday"])
+    years = 2 * copy
+    target_year = dates.dt.year + years
+    is_leap = (target_year % 4 == 0) & ((target_year % 100 != 0) | (target_year % 400 == 0))
+    df = df[~((dates.dt.month == 2) & (dates.dt.day == 29) & ~is_leap)]
+    dates = dates[df.index] + pd.DateOffset(years=years)
+    # weekday mengikuti day.csv: 0 = Minggu
+    weekday = (dates.dt.dayofweek + 1) % 7
+    return df.assign(
+        dteday=dates.dt.strftime("%Y-%m-%d"),
+        yr=df["yr"] + years,
+        weekday=weekday,
+        workingday=((weekday >= 1) & (weekday <= 5) & (df["holiday"] == 0)).astype(int),
+    )
+
+
+def generate(scale, out_dir, source_dir=SOURCE_DIR, seed=0):
+    """Tulis day.csv dan hour.csv sintetis berukuran sekitar `scale` kali ke `out_dir`.
+
+    hour.csv ditulis per blok sehingga memori tetap sebesar data asli.
+    Mengembalikan (jumlah baris day.csv, jumlah baris hour.csv).
+    """
+    rng = np.random.default_rng(seed)
+    day_df = pd.read_csv(os.path.join(source_dir, "day.csv"))
+    hour_df = pd.read_csv(os.path.join(source_dir, "hour.csv"))
+    os.makedirs(out_dir, exist_ok=True)
+
+    copies = min(scale, MAX_CALENDAR_COPIES)
+    calendars = [(shift_calendar(day_df, copy), shift_calendar(hour_df, copy)) for copy in range(copies)]
+    day_totals = [np.zeros((len(day), 2), dtype=np.int64) for day, _ in calendars]
+    positions = [pd.Index(day["dteday"]).get_indexer(hour["dteday"]) for day, hour in calendars]
+
+    hour_path = os.path.join(out_dir, "hour.csv")
+    hour_rows = 0
+    for block in range(scale):
+        copy = block % copies
+        hour = calendars[copy][1]
+        casual, registered = _station_counts(hour, rng)
+        chunk = hour.assign(
+            instant=np.arange(len(hour)) + hour_rows + 1,
+            casual=casual,
+            registered=registered,
+            cnt=casual + registered,
+        )
+        chunk.to_csv(hour_path, mode="w" if block == 0 else "a", header=block == 0, index=False)
+        np.add.at(day_totals[copy], positions[copy], np.column_stack([casual, registered]))
+        hour_rows += len(chunk)
+
+    days = []
+    for (day, _), totals in zip(calendars, day_totals):
+        days.append(day.assign(casual=totals[:, 0], registered=totals[:, 1], cnt=totals.sum(axis=1)))
+    days = pd.concat(days, ignore_index=True)
+    days["instant"] = np.arange(len(days)) + 1
+    days.to_csv(os.path.join(out_dir, "day.csv"), index=False)
+    return len(days), hour_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Buat day.csv/hour.csv sintetis berukuran N kali data asli.")
+    parser.add_argument("--scale", type=int, required=True, help="kelipatan data asli (salinan kalender x stasiun)")
+    parser.add_argument("--output", required=True, help="direktori output")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    day_rows, hour_rows = generate(args.scale, args.output, seed=args.seed)
+    print(f"{day_rows} baris day.csv dan {hour_rows} baris hour.csv ditulis ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
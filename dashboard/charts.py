@@ -0,0 +1,164 @@
+"""Grafik dashboard yang perhitungannya dipisah dari Streamlit.
+
+Grafik dibuat sebagai matplotlib Figure biasa (tanpa pyplot), sehingga aman
+di-render dari thread lain dan tidak tertinggal di registry figure global.
+"""
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+import seaborn as sns
+
+from schema import DAY_LABELS, SEASON_LABELS, WEATHER_LABELS
+
+# Di atas jumlah titik ini panel korelasi memakai hexbin, bukan scatter per titik
+HEXBIN_THRESHOLD = 2000
+# Kuantil normal untuk pita kepercayaan 95% garis regresi
+Z_95 = 1.959964
+
+# Grafik rata-rata harian: kolom kode -> (kolom label, mapping label, judul, label x, label y)
+AVERAGE_CHARTS = {
+    "season_x": ("Musim", SEASON_LABELS, "Rata-rata Penyewaan Sepeda Berdasarkan Musim", "Bulan", "Jumlah Penyewaa"),
+    "workingday_x": ("Hari", DAY_LABELS, "Rata-rata Penyewaan Sepeda pada Hari Kerja vs Akhir Pekan", "Jenis Hari", "Rata-rata Penyewaan"),
+    "weathersit_x": ("Cuaca", WEATHER_LABELS, "Rata-rata Penyewaan Sepeda Berdasarkan Kondisi Cuaca", "Cuaca", "Jumlah Penyewaa"),
+}
+MONTH_LABELS = ["Jan", "Feb", "Mar", "Apr", "Mei", "Jun", "Jul", "Agu", "Sep", "Okt", "Nov", "Des"]
+
+# Pasangan (x, y, judul, label x, label y, warna titik, warna garis, colormap hexbin)
+CORRELATION_PAIRS = [
+    ("temp_x", "cnt_x", "Temperatur vs Penyewaan", "Temperatur", "Jumlah Penyewaa", "red", "darkred", "Reds"),
+    ("hum_x", "cnt_x", "Kelembaban vs Penyewaan", "Kelembaban", "Jumlah Penyewaa", "blue", "darkblue", "Blues"),
+    ("temp_x", "hum_x", "Temperatur vs Kelembaban", "Temperatur", "Kelembaban", "green", "darkgreen", "Greens"),
+]
+
+
+def plot_average_bar(avg, key):
+    """Barplot rata-rata penyewaan harian per musim/hari/cuaca.
+
+    `avg` adalah hasil cube.average_per_day untuk kolom kode `key`.
+    """
+    label_column, labels, title, xlabel, ylabel = AVERAGE_CHARTS[key]
+    avg = avg.assign(**{label_column: avg[key].map(labels)}).sort_values(by="cnt", ascending=True)
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    sns.barplot(x=label_column, y="cnt", data=avg, palette=sns.color_palette("Blues", len(avg)), ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    return fig
+
+
+def plot_monthly_trend(sewa_bulan):
+    """Line chart total penyewaan per bulan, satu garis per tahun."""
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    for year in sewa_bulan["year"].unique():
+        subset = sewa_bulan[sewa_bulan["year"] == year]
+        ax.plot(subset["month"], subset["cnt"], marker="o", label=str(year))
+
+    ax.set_xticks(range(1, 13))
+    ax.set_xticklabels(MONTH_LABELS)
+    ax.set_title("Tren Penyewaan Sepeda 2011-2012")
+    ax.set_xlabel("Bulan")
+    ax.set_ylabel("Jumlah Penyewaa")
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+
+def plot_time_of_day(ratarata_kategori_waktu):
+    """Barplot rata-rata penyewaan per kategori waktu (hasil cube.average_per_hour)."""
+    ratarata_kategori_waktu = ratarata_kategori_waktu.rename(columns={"bucket": "Waktu"})
+    ratarata_kategori_waktu = ratarata_kategori_waktu.sort_values(by="cnt", ascending=True)
+    num_colors = len(ratarata_kategori_waktu)
+    color_palette = sns.color_palette("Blues", num_colors + 2)[1:]
+    colors = dict(zip(ratarata_kategori_waktu["Waktu"], color_palette))
+
+    fig = Figure(figsize=(5, 3))
+    ax = fig.subplots()
+    sns.barplot(
+        x="Waktu",
+        y="cnt",
+        hue="Waktu",
+        data=ratarata_kategori_waktu,
+        palette=colors,
+        legend=False,
+        ax=ax
+    )
+    ax.set_title("Rata-rata Penyewaan Sepeda Berdasarkan Kategori Waktu", fontsize=10)
+    ax.set_xlabel("Kategori Waktu", fontsize=8)
+    ax.set_ylabel("Rata-rata Jumlah Penyewaan", fontsize=8)
+    return fig
+
+
+def correlation_stats(df, columns):
+    """Matriks korelasi dan statistik regresi dari satu matriks kovarians.
+
+    Mengembalikan (korelasi, mean, cov, n). Semua garis regresi pada panel
+    dihitung dari hasil ini dengan rumus tertutup, tanpa bootstrap.
+    """
+    values = df[columns].to_numpy(dtype=np.float64)
+    n = len(values)
+    mean = values.mean(axis=0) if n else np.full(len(columns), np.nan)
+    centered = values - mean
+    cov = centered.T @ centered
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = cov / np.outer(std, std)
+    korelasi = pd.DataFrame(corr, index=columns, columns=columns)
+    return korelasi, mean, cov, n
+
+
+def regression_line(mean, cov, n, i, j, x_grid):
+    """Garis least squares y_j ~ x_i beserta pita kepercayaan 95% untuk rata-rata.
+
+    `cov` berisi jumlah hasil kali terpusat (belum dibagi n). Mengembalikan
+    (y, bawah, atas) pada `x_grid`, atau None jika datanya tidak cukup.
+    """
+    sxx, sxy, syy = cov[i, i], cov[i, j], cov[j, j]
+    if n < 3 or sxx <= 0:
+        return None
+    slope = sxy / sxx
+    y = mean[j] + slope * (x_grid - mean[i])
+    residual_var = max(syy - slope * sxy, 0.0) / (n - 2)
+    band = Z_95 * np.sqrt(residual_var * (1.0 / n + (x_grid - mean[i]) ** 2 / sxx))
+    return y, y - band, y + band
+
+
+def plot_correlation_panel(df, threshold=HEXBIN_THRESHOLD):
+    """Panel 3 grafik korelasi temperatur, kelembaban dan penyewaan.
+
+    Jika baris lebih dari `threshold`, titik digambar sebagai hexbin kepadatan
+    agar waktu render tidak tumbuh per baris.
+    """
+    columns = ["temp_x", "hum_x", "cnt_x"]
+    _, mean, cov, n = correlation_stats(df, columns)
+    fig = Figure(figsize=(15, 5))
+    ax = fig.subplots(nrows=1, ncols=3)
+
+    for k, (x_col, y_col, title, xlabel, ylabel, color, line_color, cmap) in enumerate(CORRELATION_PAIRS):
+        x = df[x_col].to_numpy()
+        y = df[y_col].to_numpy()
+        if n > threshold:
+            ax[k].hexbin(x, y, gridsize=40, cmap=cmap, mincnt=1)
+            ax[k].plot([], [], "h", color=color, label="Data (kepadatan)")
+        elif n:
+            ax[k].scatter(x, y, alpha=0.6, color=color, label="Data")
+
+        i, j = columns.index(x_col), columns.index(y_col)
+        x_grid = np.linspace(x.min(), x.max(), 100) if n else np.array([])
+        fit = regression_line(mean, cov, n, i, j, x_grid)
+        if fit is not None:
+            y_fit, lower, upper = fit
+            ax[k].plot(x_grid, y_fit, color=line_color, label="Regresi")
+            ax[k].fill_between(x_grid, lower, upper, color=line_color, alpha=0.15)
+
+        ax[k].set_title(title, fontsize=14)
+        ax[k].set_xlabel(xlabel, fontsize=12)
+        ax[k].set_ylabel(ylabel, fontsize=12)
+        ax[k].tick_params(axis='x', rotation=45)
+        ax[k].grid(True, linestyle="--", alpha=0.7)
+        if n:
+            ax[k].legend()
+
+    fig.suptitle("Korelasi Temperatur, Kelembaban, dan Penyewaan", fontsize=20)
+    return fig
@@ -0,0 +1,58 @@
+"""Cube agregat untuk filter dashboard.
+
+Cube menyimpan jumlah (sum) `cnt`/`casual`/`registered` per jam dan banyaknya
+baris (`n`) untuk setiap kombinasi (tanggal, jam, musim, hari kerja, cuaca).
+Grafik dihitung dari roll-up cube (per tanggal di shared.SharedDataset, per jam
+di average_per_hour), sehingga biaya filter sebanding dengan jumlah kunci unik,
+bukan jumlah baris mentah.
+"""
+import numpy as np
+import pandas as pd
+
+# Kunci cube: kolom harian (_x) yang dipakai filter sidebar, ditambah jam
+KEYS = ["dteday_x", "hr", "season_x", "workingday_x", "weathersit_x"]
+DAY_KEYS = ["dteday_x", "season_x", "workingday_x", "weathersit_x"]
+MEASURES = {"cnt": "cnt_y", "casual": "casual_y", "registered": "registered_y"}
+
+
+def build_cube(df):
+    """Agregasikan data per jam hasil join menjadi cube (sum per ukuran + jumlah baris)."""
+    grouped = df.groupby(KEYS, sort=False, observed=True)
+    # Dijumlahkan sebagai int64 agar total bulanan tidak overflow dari kolom int32
+    cube = grouped[list(MEASURES.values())].sum().astype("int64").rename(columns={v: k for k, v in MEASURES.items()})
+    cube["n"] = grouped.size()
+    return cube.reset_index()
+
+
+def combine_cubes(cubes):
+    """Gabungkan cube parsial (per batch/partisi/ingest) menjadi satu cube.
+
+    Kunci yang muncul di lebih dari satu bagian dijumlahkan, jadi biayanya
+    sebanding dengan jumlah kunci, bukan jumlah baris mentah.
+    """
+    cubes = [cube for cube in cubes if len(cube)]
+    if not cubes:
+        return pd.DataFrame(columns=KEYS + list(MEASURES) + ["n"])
+    return pd.concat(cubes).groupby(KEYS, sort=False, observed=True).sum().reset_index()
+
+
+def daily_totals(cube):
+    """Total penyewaan per tanggal; sama dengan `cnt` pada day.csv."""
+    return cube.groupby(DAY_KEYS, sort=False, observed=True)["cnt"].sum().reset_index()
+
+
+def average_per_day(daily, key):
+    """Rata-rata penyewaan harian per nilai `key` (season_x/workingday_x/weathersit_x)."""
+    return daily.groupby(key, observed=True)["cnt"].mean().reset_index()
+
+
+def average_per_hour(cube, buckets=None):
+    """Rata-rata penyewaan per jam, atau per kelompok jam jika `buckets` diberikan.
+
+    `buckets` adalah array berukuran 24 yang memetakan jam ke label kelompok.
+    """
+    hourly = cube.groupby("hr")[["cnt", "n"]].sum()
+    if buckets is not None:
+        hourly = hourly.groupby(np.asarray(buckets)[hourly.index]).sum().rename_axis("bucket")
+    hourly["cnt"] = hourly["cnt"] / hourly["n"]
+    return hourly[["cnt"]].reset_index()
@@ -0,0 +1,232 @@
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import pyarrow.parquet as pq
+
+from cube import combine_cubes
+
+# Lokasi file sumber dan cache kolumnar. BIKE_DATA_DIR/BIKE_CACHE_DIR bisa dipakai
+# untuk mengarahkan dashboard ke data lain, misalnya data sintetis benchmark.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BASE_DIR)
+CACHE_DIR = os.environ.get("BIKE_CACHE_DIR", os.path.join(BASE_DIR, ".cache"))
+DATA_DIR = os.environ.get("BIKE_DATA_DIR", os.path.join(ROOT_DIR, "data", "Bike-sharing-dataset"))
+DAY_CSV = os.path.join(DATA_DIR, "day.csv")
+HOUR_CSV = os.path.join(DATA_DIR, "hour.csv")
+# Drop yang diterima ingest.py (satu direktori per batch berisi day.csv, hour.csv
+# dan batch.json). Ikut menjadi sumber store dan diputar ulang setiap build ulang.
+DROPS_DIR = os.path.join(DATA_DIR, "drops")
+BATCH_NAME = "batch.json"
+
+# Hasil join day/hour, dipartisi per year=/month=. HOURLY_DIR berisi beberapa
+# versi store (subdirektori v-*); CURRENT_NAME menunjuk versi yang aktif.
+HOURLY_DIR = os.path.join(CACHE_DIR, "hourly")
+CURRENT_NAME = "_current.json"
+LOCK_NAME = "_lock"
+MANIFEST_NAME = "_manifest.json"
+# Cube agregat tersimpan di dalam store, satu file per chunk build/batch ingest
+AGGREGATES_DIR = "_aggregates"
+# Tabel harian (kolom day.csv berakhiran _x, satu baris per tanggal), terpartisi year=
+DAYS_DIR = "_days"
+
+# Naikkan jika skema/tata letak file cache berubah agar cache lama dibangun ulang
+FORMAT_VERSION = 6
+
+
+def file_hash(path, block_size=1 << 20):
+    """Hash sha256 isi file, dibaca per blok agar hemat memori."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_meta(meta_path):
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_meta(meta_path, meta):
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, meta_path)
+
+
+def check_sources(paths, meta):
+    """Bandingkan file sumber dengan fingerprint yang tersimpan di `meta`.
+
+    Mengembalikan (masih_valid, fingerprint_terbaru). Cache dengan FORMAT_VERSION
+    lain selalu dianggap basi. Hash hanya dihitung untuk file yang mtime-nya
+    berubah, jadi `touch` atau checkout ulang tidak memicu build ulang selama
+    isinya sama.
+    """
+    stored = (meta or {}).get("sources", {})
+    sources = {}
+    fresh = meta is not None and meta.get("format") == FORMAT_VERSION
+    for path in paths:
+        key = os.path.relpath(path, ROOT_DIR)
+        mtime = os.path.getmtime(path)
+        old = stored.get(key)
+        if old is not None and old["mtime"] == mtime:
+            sources[key] = old
+            continue
+        digest = file_hash(path)
+        sources[key] = {"mtime": mtime, "sha256": digest}
+        if old is None or old["sha256"] != digest:
+            fresh = False
+    # File sumber yang hilang (misalnya drop yang dihapus) juga membuat cache basi
+    if set(stored) != set(sources):
+        fresh = False
+    return fresh, sources
+
+
+def drop_dirs():
+    """Direktori drop yang sudah diterima, urut sesuai waktu ingest."""
+    if not os.path.isdir(DROPS_DIR):
+        return []
+    names = sorted(n for n in os.listdir(DROPS_DIR) if not n.endswith(".tmp"))
+    return [os.path.join(DROPS_DIR, n) for n in names if os.path.isdir(os.path.join(DROPS_DIR, n))]
+
+
+def source_paths():
+    """Semua file sumber store: day.csv, hour.csv dan CSV setiap drop."""
+    paths = [DAY_CSV, HOUR_CSV]
+    for drop in drop_dirs():
+        paths += [os.path.join(drop, "day.csv"), os.path.join(drop, "hour.csv")]
+    return paths
+
+
+@contextlib.contextmanager
+def store_lock(root=HOURLY_DIR):
+    """Lock eksklusif antar proses/thread untuk build dan ingest store di `root`.
+
+    Tidak re-entrant: fungsi yang dipanggil di dalam lock tidak boleh mengambilnya lagi.
+    """
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, LOCK_NAME), "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK menyerah setelah ~10 detik; terus tunggu
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def current_store(root=HOURLY_DIR):
+    """Direktori versi store yang aktif di `root`, atau None jika belum ada."""
+    pointer = read_meta(os.path.join(root, CURRENT_NAME))
+    if pointer is None:
+        return None
+    store = os.path.join(root, pointer["version"])
+    return store if os.path.isdir(store) else None
+
+
+def publish_store(root, store):
+    """Jadikan `store` versi aktif di `root` lewat satu rename atomik.
+
+    Pembaca yang sedang memakai versi sebelumnya tidak terganggu karena versi
+    itu disimpan sampai penggantinya diganti lagi; versi lain yang lebih lama
+    (atau sisa build yang gagal) dihapus. Harus dipanggil di dalam store_lock.
+    """
+    previous = current_store(root)
+    write_meta(os.path.join(root, CURRENT_NAME), {"version": os.path.basename(store)})
+    keep = {os.path.basename(store), os.path.basename(previous or "")}
+    for name in os.listdir(root):
+        if name.startswith("v-") and name not in keep:
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def clone_store(store, root=HOURLY_DIR):
+    """Versi store baru (belum aktif) di `root` dengan isi yang sama dengan `store`.
+
+    File di-hard link, bukan disalin (disalin hanya jika hard link tidak
+    didukung), jadi biayanya sebanding dengan jumlah file, bukan ukuran data.
+    File di store tidak pernah diubah di tempat, sehingga versi lama tetap utuh.
+    """
+    clone = tempfile.mkdtemp(prefix="v-", dir=root)
+    for dirpath, _, filenames in os.walk(store):
+        target = os.path.join(clone, os.path.relpath(dirpath, store))
+        os.makedirs(target, exist_ok=True)
+        for name in filenames:
+            try:
+                os.link(os.path.join(dirpath, name), os.path.join(target, name))
+            except OSError:
+                shutil.copy2(os.path.join(dirpath, name), os.path.join(target, name))
+    return clone
+
+
+def _store_sources(store):
+    meta = read_meta(os.path.join(store, MANIFEST_NAME)) if store else None
+    return meta, check_sources(source_paths(), meta)
+
+
+def refresh_store(root=HOURLY_DIR):
+    """Seperti ensure_hourly_store, untuk pemanggil yang sudah memegang store_lock(root)."""
+    # Import di sini karena etl juga memakai konstanta dari modul ini
+    from etl import build_hourly_store
+
+    store = current_store(root)
+    meta, (fresh, sources) = _store_sources(store)
+    if not fresh:
+        build_hourly_store(DAY_CSV, HOUR_CSV, root, sources=sources, drops=drop_dirs())
+        return current_store(root)
+    if sources != meta["sources"]:
+        meta["sources"] = sources
+        write_meta(os.path.join(store, MANIFEST_NAME), meta)
+    return store
+
+
+def ensure_hourly_store(root=HOURLY_DIR):
+    """Pastikan store per jam sesuai dengan sumbernya; kembalikan direktori versinya.
+
+    Sumbernya day.csv, hour.csv dan semua drop yang sudah diterima (lihat
+    ingest.py). Jalur cepat (store masih valid) tidak mengambil lock. Build
+    ulang dilakukan di dalam store_lock dan dicek ulang di sana, jadi sesi
+    yang bersamaan melihat sumber basi hanya membangun sekali.
+    """
+    store = current_store(root)
+    meta, (fresh, sources) = _store_sources(store)
+    if fresh and sources == meta["sources"]:
+        return store
+    with store_lock(root):
+        return refresh_store(root)
+
+
+def hourly_version():
+    """Versi store per jam (versi aktif + mtime manifest), dipakai sebagai kunci cache Streamlit."""
+    store = ensure_hourly_store()
+    return os.path.basename(store), os.path.getmtime(os.path.join(store, MANIFEST_NAME))
+
+
+def load_cube():
+    """Cube agregat tersimpan (lihat cube.py); data per jam tidak ikut dibaca."""
+    aggregates = os.path.join(ensure_hourly_store(), AGGREGATES_DIR)
+    table = pq.read_table(aggregates, partitioning=None, memory_map=True)
+    return combine_cubes([table.to_pandas()])
@@ -0,0 +1,181 @@
+"""ETL join data harian (day.csv) dan per jam (hour.csv) berdasarkan tanggal.
+
+Setiap baris per jam dipasangkan dengan baris harian pada `dteday` yang sama.
+Kolom harian diberi akhiran `_x` dan kolom per jam akhiran `_y`, sama seperti
+`all_data` di notebook. hour.csv dibaca per chunk sehingga memori tetap terbatas,
+lalu hasilnya ditulis sebagai Parquet terpartisi `year=YYYY/month=M`. Baris
+day.csv untuk tanggal yang sama juga disimpan sebagai tabel harian (`_days`,
+terpartisi per tahun) agar query per tanggal tidak perlu membaca baris per
+jam. Drop yang sudah diterima ingest.py diputar ulang di atas hasil build ini.
+
+Jalankan: python dashboard/etl.py [--chunksize N] [--output DIR]
+"""
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cube import build_cube
+from data_store import (
+    AGGREGATES_DIR, BATCH_NAME, DAY_CSV, DAYS_DIR, FORMAT_VERSION, HOUR_CSV, HOURLY_DIR, MANIFEST_NAME,
+    check_sources, drop_dirs, publish_store, read_meta, store_lock, write_meta,
+)
+from schema import apply_schema
+
+# Urutan kolom hasil join
+DAY_COLUMNS = [
+    "dteday", "season", "yr", "mnth", "holiday", "weekday", "workingday", "weathersit",
+    "temp", "atemp", "hum", "windspeed", "casual", "registered", "cnt",
+]
+HOUR_COLUMNS = DAY_COLUMNS[:4] + ["hr"] + DAY_COLUMNS[4:]
+COLUMNS = (
+    ["instant"]
+    + [f"{c}_x" for c in DAY_COLUMNS]
+    + [c if c == "hr" else f"{c}_y" for c in HOUR_COLUMNS]
+)
+PARTITION_COLUMNS = ["year", "month"]
+# Tabel harian cukup dipartisi per tahun (365 baris per file); dalam file baris urut tanggal
+DAY_PARTITION_COLUMNS = ["year"]
+
+
+def read_day(day_path):
+    """Baca day.csv utuh (satu baris per tanggal, ukurannya kecil)."""
+    return pd.read_csv(day_path, parse_dates=["dteday"])
+
+
+def iter_hour_chunks(hour_path, chunksize):
+    """Baca hour.csv per chunk agar tidak pernah dimuat seluruhnya ke memori."""
+    return pd.read_csv(hour_path, parse_dates=["dteday"], chunksize=chunksize)
+
+
+def join_day_hour(day_df, hour_df):
+    """Join baris per jam ke baris harian pada `dteday` (bukan `instant`)."""
+    day = day_df[DAY_COLUMNS].add_suffix("_x")
+    hour = hour_df.rename(columns={c: f"{c}_y" for c in HOUR_COLUMNS if c != "hr"})
+    all_data = hour.merge(day, left_on="dteday_y", right_on="dteday_x", how="inner", validate="many_to_one")
+    return all_data[COLUMNS]
+
+
+def write_partitions(all_data, out_dir, part):
+    """Tulis satu chunk hasil join ke partisi year=/month= di `out_dir`."""
+    all_data = apply_schema(all_data).assign(
+        year=all_data["dteday_x"].dt.year,
+        month=all_data["dteday_x"].dt.month,
+    )
+    table = pa.Table.from_pandas(all_data, preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        out_dir,
+        partition_cols=PARTITION_COLUMNS,
+        basename_template=f"part-{part}-{{i}}.parquet",
+    )
+
+
+def write_cube_part(all_data, out_dir, name):
+    """Simpan cube dari `all_data` sebagai satu bagian cube agregat di store."""
+    aggregates = os.path.join(out_dir, AGGREGATES_DIR)
+    os.makedirs(aggregates, exist_ok=True)
+    cube = build_cube(apply_schema(all_data))
+    pq.write_table(pa.Table.from_pandas(cube, preserve_index=False), os.path.join(aggregates, f"cube-{name}.parquet"))
+
+
+def write_days_part(day_df, out_dir, name):
+    """Simpan baris day.csv (`day_df`, tanpa akhiran) sebagai satu bagian tabel harian di store.
+
+    Tabel harian dipartisi year= saja: partisi per bulan menghasilkan ratusan file
+    kecil yang membuat scan lebih lambat daripada membaca semuanya (lihat query.py).
+    """
+    days = apply_schema(day_df[DAY_COLUMNS].add_suffix("_x").sort_values("dteday_x"))
+    days = days.assign(year=days["dteday_x"].dt.year)
+    pq.write_to_dataset(
+        pa.Table.from_pandas(days, preserve_index=False),
+        os.path.join(out_dir, DAYS_DIR),
+        partition_cols=DAY_PARTITION_COLUMNS,
+        basename_template=f"days-{name}-{{i}}.parquet",
+    )
+
+
+def write_batch(day_df, hour_df, out_dir, name):
+    """Join satu batch day/hour lalu tulis partisi, bagian cube dan tabel harian-nya ke `out_dir`."""
+    all_data = apply_schema(join_day_hour(day_df, hour_df))
+    write_partitions(all_data, out_dir, name)
+    write_cube_part(all_data, out_dir, name)
+    write_days_part(day_df, out_dir, name)
+    return len(all_data)
+
+
+def read_drop(drop):
+    """Baca drop yang sudah diterima: (day_df, hour_df, batch)."""
+    day_df = read_day(os.path.join(drop, "day.csv"))
+    hour_df = pd.read_csv(os.path.join(drop, "hour.csv"), parse_dates=["dteday"])
+    return day_df, hour_df, read_meta(os.path.join(drop, BATCH_NAME))
+
+
+def build_hourly_store(
+    day_path=DAY_CSV, hour_path=HOUR_CSV, out_dir=HOURLY_DIR, chunksize=100_000, sources=None, drops=(),
+):
+    """Bangun ulang store per jam dari CSV sumber, chunk demi chunk.
+
+    Hasil ditulis ke direktori versi baru di `out_dir` lalu diaktifkan lewat
+    publish_store, jadi pembaca tidak pernah melihat store yang setengah jadi.
+    Harus dipanggil di dalam store_lock(out_dir). Cube agregat ikut ditulis per
+    chunk (lihat write_cube_part), tabel harian sekali di akhir. Setelah itu
+    setiap drop di `drops` diputar ulang; tanggal yang sudah ada dilewati.
+    Manifest menyimpan fingerprint sumber (`sources`, dihitung jika tidak
+    diberikan) dan batch yang diputar ulang. Mengembalikan jumlah baris.
+    """
+    if sources is None:
+        paths = [day_path, hour_path]
+        for drop in drops:
+            paths += [os.path.join(drop, "day.csv"), os.path.join(drop, "hour.csv")]
+        sources = check_sources(paths, None)[1]
+    day_df = read_day(day_path)
+    os.makedirs(out_dir, exist_ok=True)
+    store = tempfile.mkdtemp(prefix="v-", dir=out_dir)
+
+    rows = 0
+    joined_dates = set()
+    for part, hour_chunk in enumerate(iter_hour_chunks(hour_path, chunksize)):
+        all_data = apply_schema(join_day_hour(day_df, hour_chunk))
+        write_partitions(all_data, store, part)
+        write_cube_part(all_data, store, f"build-{part}")
+        joined_dates.update(all_data["dteday_x"].unique())
+        rows += len(all_data)
+    # Tabel harian hanya untuk tanggal yang punya data per jam, sama seperti hasil join
+    write_days_part(day_df[day_df["dteday"].isin(joined_dates)], store, "build")
+
+    batches = []
+    for drop in drops:
+        drop_day, drop_hour, batch = read_drop(drop)
+        drop_day = drop_day[~drop_day["dteday"].isin(joined_dates)]
+        drop_hour = drop_hour[drop_hour["dteday"].isin(drop_day["dteday"])]
+        if len(drop_day):
+            rows += write_batch(drop_day, drop_hour, store, f"ingest-{batch['id']}")
+            joined_dates.update(drop_day["dteday"].to_numpy())
+        batches.append(batch)
+    write_meta(
+        os.path.join(store, MANIFEST_NAME), {"format": FORMAT_VERSION, "sources": sources, "batches": batches}
+    )
+
+    publish_store(out_dir, store)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Join day.csv dan hour.csv per tanggal ke Parquet terpartisi.")
+    parser.add_argument("--day", default=DAY_CSV, help="path day.csv")
+    parser.add_argument("--hour", default=HOUR_CSV, help="path hour.csv")
+    parser.add_argument("--output", default=HOURLY_DIR, help="direktori store (berisi versi terpartisi year=/month=)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="jumlah baris hour.csv per chunk")
+    args = parser.parse_args()
+
+    with store_lock(args.output):
+        rows = build_hourly_store(args.day, args.hour, args.output, args.chunksize, drops=drop_dirs())
+    print(f"{rows} baris ditulis ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
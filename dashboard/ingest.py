@@ -0,0 +1,225 @@
+"""Ingest data day/hour baru ke store per jam tanpa membangun ulang riwayat.
+
+Hanya tanggal (`dteday`) yang belum ada di store yang ditambahkan. Baris
+divalidasi terhadap skema day.csv/hour.csv (termasuk format tanggal, yr/mnth
+yang sesuai dengan dteday, dan total harian yang sama dengan jumlah per jam),
+di-join per tanggal (etl.py), lalu
+ditulis sebagai file baru di partisi year=/month= yang sesuai. Cube agregat
+(sumber grafik musim, hari, cuaca, tren bulanan dan kategori waktu) dan tabel
+harian diperbarui dengan menambah satu bagian untuk baris baru saja.
+
+Drop yang diterima disimpan dulu di DROPS_DIR (di samping day.csv/hour.csv)
+dan menjadi sumber store, jadi setiap build ulang (CSV sumber berubah,
+FORMAT_VERSION naik atau cache dihapus) memutarnya ulang. Batch baru ditulis
+ke versi store baru (hard link ke file versi aktif + file batch) yang
+diaktifkan dengan satu rename, di dalam store_lock: ingest yang gagal di
+tengah jalan tidak meninggalkan store setengah jadi, dan dua ingest yang
+bersamaan tidak menambahkan tanggal yang sama dua kali. Biaya ingest sebanding
+dengan data baru (dan jumlah file store), bukan dengan seluruh riwayat.
+
+Jalankan: python dashboard/ingest.py --day drop/day.csv --hour drop/hour.csv
+"""
+import argparse
+import datetime
+import os
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from data_store import (
+    BATCH_NAME, DROPS_DIR, HOURLY_DIR, MANIFEST_NAME, check_sources, clone_store, publish_store, read_meta,
+    refresh_store, source_paths, store_lock, write_meta,
+)
+from etl import DAY_COLUMNS, HOUR_COLUMNS, write_batch
+from query import open_days, scan_days
+from schema import DAY_LABELS, DTYPES, SEASON_LABELS, WEATHER_LABELS
+
+# Rentang nilai yang sah untuk kolom kode
+CODE_RANGES = {
+    "season": set(SEASON_LABELS),
+    "workingday": set(DAY_LABELS),
+    "weathersit": set(WEATHER_LABELS),
+    "holiday": {0, 1},
+    "weekday": set(range(7)),
+    "mnth": set(range(1, 13)),
+    "hr": set(range(24)),
+}
+# Format dteday di day.csv/hour.csv; `yr` dihitung dari tahun pertama data
+DATE_FORMAT = "%Y-%m-%d"
+FIRST_YEAR = 2011
+TOTALS = ["casual", "registered", "cnt"]
+
+
+class ValidationError(ValueError):
+    """Data drop tidak sesuai dengan skema store."""
+
+
+def read_drop_csv(path):
+    """Baca CSV drop; dteday yang bukan tanggal DATE_FORMAT menjadi NaT (ditolak oleh validate)."""
+    df = pd.read_csv(path, dtype={"dteday": str})
+    if "dteday" in df.columns:
+        df["dteday"] = pd.to_datetime(df["dteday"], format=DATE_FORMAT, errors="coerce")
+    return df
+
+
+def _validate_frame(df, columns, name):
+    problems = []
+    expected = ["instant"] + columns
+    missing = [c for c in expected if c not in df.columns]
+    extra = [c for c in df.columns if c not in expected]
+    if missing:
+        problems.append(f"{name}: kolom hilang {missing}")
+    if extra:
+        problems.append(f"{name}: kolom tidak dikenal {extra}")
+    if missing:
+        return problems
+    if df.empty:
+        problems.append(f"{name}: tidak ada baris data")
+        return problems
+
+    if not pd.api.types.is_datetime64_any_dtype(df["dteday"]) or df["dteday"].isna().any():
+        problems.append(f"{name}: dteday bukan tanggal {DATE_FORMAT} di {df['dteday'].isna().sum()} baris")
+        return problems
+    nulls = [c for c in expected if df[c].isna().any()]
+    if nulls:
+        problems.append(f"{name}: ada nilai kosong di {nulls}")
+        return problems
+
+    not_numeric = [c for c in expected if c != "dteday" and not pd.api.types.is_numeric_dtype(df[c])]
+    if not_numeric:
+        problems.append(f"{name}: kolom bukan angka {not_numeric}")
+        return problems
+
+    for column in columns:
+        dtype = DTYPES.get(column)
+        if dtype is None or not dtype.startswith("int"):
+            continue
+        values = df[column].to_numpy()
+        info = np.iinfo(dtype)
+        if not np.array_equal(values, np.round(values)) or values.min() < info.min or values.max() > info.max:
+            problems.append(f"{name}: {column} bukan bilangan bulat {dtype}")
+        elif column in CODE_RANGES and not set(np.unique(values)) <= CODE_RANGES[column]:
+            problems.append(f"{name}: {column} berisi kode di luar {sorted(CODE_RANGES[column])}")
+
+    if problems:
+        return problems
+
+    dates = df["dteday"].dt
+    calendar = df["yr"].ne(dates.year - FIRST_YEAR) | df["mnth"].ne(dates.month)
+    if calendar.any():
+        problems.append(f"{name}: yr/mnth tidak sesuai dengan dteday di {calendar.sum()} baris")
+    if not (df["casual"] + df["registered"]).eq(df["cnt"]).all():
+        problems.append(f"{name}: cnt tidak sama dengan casual + registered")
+    return problems
+
+
+def validate(day_df, hour_df):
+    """Periksa drop terhadap skema day.csv/hour.csv; lempar ValidationError jika tidak sesuai."""
+    if day_df.empty and hour_df.empty:
+        raise ValidationError("drop kosong: day dan hour tidak berisi baris data")
+    problems = _validate_frame(day_df, DAY_COLUMNS, "day") + _validate_frame(hour_df, HOUR_COLUMNS, "hour")
+    if not problems:
+        if day_df["dteday"].duplicated().any():
+            problems.append("day: dteday duplikat")
+        if hour_df.duplicated(["dteday", "hr"]).any():
+            problems.append("hour: pasangan (dteday, hr) duplikat")
+        day_dates = set(day_df["dteday"])
+        hour_dates = set(hour_df["dteday"])
+        if hour_dates - day_dates:
+            problems.append(f"hour: {len(hour_dates - day_dates)} tanggal tidak ada di day")
+        if day_dates - hour_dates:
+            problems.append(f"day: {len(day_dates - hour_dates)} tanggal tanpa data per jam")
+    if not problems:
+        # Total harian harus sama dengan jumlah baris per jam pada tanggal yang sama
+        hourly = hour_df.groupby("dteday")[TOTALS].sum()
+        daily = day_df.set_index("dteday")[TOTALS]
+        mismatched = hourly.loc[daily.index].ne(daily).any(axis=1)
+        if mismatched.any():
+            problems.append(f"day: {TOTALS} tidak sama dengan jumlah per jam pada {mismatched.sum()} tanggal")
+    if problems:
+        raise ValidationError("; ".join(problems))
+
+
+def existing_dates(dates, store):
+    """Tanggal dari `dates` yang sudah ada di versi store `store`, menurut tabel harian-nya.
+
+    Tabel harian diaktifkan bersama cube dalam versi yang sama, jadi tanggal
+    yang ada di sana pasti juga ada di cube.
+    """
+    if dates.empty:
+        return set()
+    stored = scan_days(["dteday_x"], dates.min(), dates.max(), dataset=open_days(store))["dteday_x"]
+    return set(dates[dates.isin(stored)])
+
+
+def save_drop(day_df, hour_df, batch):
+    """Simpan drop yang diterima ke DROPS_DIR (ditulis ke direktori .tmp lalu di-rename)."""
+    drop = os.path.join(DROPS_DIR, batch["id"])
+    tmp_dir = drop + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    day_df.to_csv(os.path.join(tmp_dir, "day.csv"), index=False, date_format="%Y-%m-%d")
+    hour_df.to_csv(os.path.join(tmp_dir, "hour.csv"), index=False, date_format="%Y-%m-%d")
+    write_meta(os.path.join(tmp_dir, BATCH_NAME), batch)
+    os.replace(tmp_dir, drop)
+    return drop
+
+
+def ingest(day_path, hour_path, root=HOURLY_DIR):
+    """Tambahkan tanggal baru dari drop day/hour ke store; kembalikan ringkasan batch."""
+    day_df = read_drop_csv(day_path)
+    hour_df = read_drop_csv(hour_path)
+    validate(day_df, hour_df)
+
+    with store_lock(root):
+        # Store dicek (dan drop yang belum masuk diputar ulang) di dalam lock, jadi
+        # tanggal baru ditentukan dari versi yang tidak bisa berubah sampai publish
+        store = refresh_store(root)
+        skipped = existing_dates(day_df["dteday"], store)
+        day_df = day_df[~day_df["dteday"].isin(skipped)]
+        hour_df = hour_df[~hour_df["dteday"].isin(skipped)]
+        batch = {
+            "id": datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S%f") + "-" + uuid.uuid4().hex[:6],
+            "source": {"day": os.path.abspath(day_path), "hour": os.path.abspath(hour_path)},
+            "rows": len(hour_df),
+            "days": len(day_df),
+            "skipped_days": len(skipped),
+        }
+        if day_df.empty:
+            return batch
+        batch["dates"] = [str(day_df["dteday"].min().date()), str(day_df["dteday"].max().date())]
+
+        # Urutan: drop disimpan dulu (jika gagal setelah ini, build ulang memutarnya),
+        # lalu versi baru ditulis lengkap dan diaktifkan sekaligus
+        save_drop(day_df, hour_df, batch)
+        new_store = clone_store(store, root)
+        write_batch(day_df, hour_df, new_store, f"ingest-{batch['id']}")
+        manifest_path = os.path.join(new_store, MANIFEST_NAME)
+        meta = read_meta(manifest_path)
+        meta.setdefault("batches", []).append(batch)
+        meta["sources"] = check_sources(source_paths(), meta)[1]
+        write_meta(manifest_path, meta)
+        publish_store(root, new_store)
+    return batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tambahkan tanggal baru dari drop CSV day/hour ke store dashboard.")
+    parser.add_argument("--day", required=True, help="CSV harian baru (skema day.csv)")
+    parser.add_argument("--hour", required=True, help="CSV per jam baru (skema hour.csv)")
+    args = parser.parse_args()
+
+    try:
+        batch = ingest(args.day, args.hour)
+    except ValidationError as error:
+        parser.exit(1, f"drop ditolak: {error}\n")
+    print(
+        f"{batch['days']} tanggal baru ({batch['rows']} baris per jam) ditambahkan, "
+        f"{batch['skipped_days']} tanggal sudah ada dilewati"
+    )
+
+
+if __name__ == "__main__":
+    main()
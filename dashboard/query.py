@@ -0,0 +1,61 @@
+"""Query per tanggal ke tabel harian store (Parquet terpartisi year=).
+
+Dashboard membaca dua hal dari store: cube agregat (data_store.load_cube,
+dibaca utuh sekali per versi karena kecil) dan tabel harian untuk grafik
+korelasi. Untuk tabel harian, rentang tanggal diterjemahkan ke predikat
+partisi year sehingga hanya direktori tahun yang relevan yang dibuka; di dalam
+file baris urut tanggal sehingga statistik row group ikut memangkas. Filter
+musim/hari/cuaca ikut dikirim ke scan. Hanya kolom yang diminta
+yang dibaca.
+"""
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from data_store import DAYS_DIR, ensure_hourly_store
+
+
+def open_days(store=None):
+    """Dataset pyarrow atas tabel harian store (satu baris per tanggal), default versi aktif."""
+    return ds.dataset(os.path.join(store or ensure_hourly_store(), DAYS_DIR), format="parquet", partitioning="hive")
+
+
+def date_filter(start_date, end_date):
+    """Predikat rentang tanggal, termasuk predikat partisi year untuk pruning."""
+    partitions = (ds.field("year") >= start_date.year) & (ds.field("year") <= end_date.year)
+    dates = (ds.field("dteday_x") >= pa.scalar(start_date, pa.timestamp("ns"))) & (
+        ds.field("dteday_x") <= pa.scalar(end_date, pa.timestamp("ns"))
+    )
+    return partitions & dates
+
+
+def category_filter(seasons, workingdays, weathers):
+    """Predikat kode musim/hari kerja/cuaca yang dipilih."""
+    expression = None
+    for column, codes in (("season_x", seasons), ("workingday_x", workingdays), ("weathersit_x", weathers)):
+        predicate = ds.field(column).isin(pa.array(codes, type=pa.int8()))
+        expression = predicate if expression is None else expression & predicate
+    return expression
+
+
+def days_filter(start_date=None, end_date=None, seasons=None, workingdays=None, weathers=None):
+    """Gabungan predikat tanggal dan kategori; filter yang bernilai None tidak dipakai.
+
+    Filter kategori hanya dipakai jika ketiganya diberikan.
+    """
+    expression = None
+    if start_date is not None and end_date is not None:
+        expression = date_filter(pd.Timestamp(start_date), pd.Timestamp(end_date))
+    if seasons is not None and workingdays is not None and weathers is not None:
+        categories = category_filter(seasons, workingdays, weathers)
+        expression = categories if expression is None else expression & categories
+    return expression
+
+
+def scan_days(columns, start_date=None, end_date=None, seasons=None, workingdays=None, weathers=None, dataset=None):
+    """Baca `columns` dari tabel harian untuk tanggal yang cocok dengan filter sebagai DataFrame."""
+    dataset = dataset or open_days()
+    expression = days_filter(start_date, end_date, seasons, workingdays, weathers)
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
@@ -0,0 +1,126 @@
+"""Render grafik ke PNG dengan cache LRU dan pool worker.
+
+Setiap grafik di-render dari input agregatnya yang kecil. Kunci cache adalah
+hash dari fungsi grafik dan inputnya; input itu sudah mencerminkan filter
+yang aktif, jadi grafik yang inputnya tidak berubah saat satu filter digeser
+langsung diambil dari cache. Grafik yang belum ada di cache di-render
+bersamaan di process pool (atau thread pool jika hanya ada satu CPU, karena
+render matplotlib tertahan GIL). Grafik dibuat sebagai matplotlib Figure
+tanpa pyplot (backend Agg, tidak ada registry global) dan dibersihkan setelah
+disimpan, jadi memori tidak terus naik pada proses yang berjalan lama.
+"""
+import hashlib
+import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+# Sama dengan pengaturan default st.pyplot
+SAVEFIG_KWARGS = {"format": "png", "dpi": 200, "bbox_inches": "tight"}
+
+
+def render_png(plot, *args):
+    """Panggil `plot(*args)` lalu simpan Figure-nya sebagai bytes PNG dan lepaskan Figure."""
+    fig = plot(*args)
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **SAVEFIG_KWARGS)
+        return buffer.getvalue()
+    finally:
+        fig.clear()
+
+
+def _digest(value, digest):
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr(list(value.columns)).encode())
+        digest.update(repr(list(value.dtypes.astype(str))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+def chart_key(plot, *args):
+    """Hash stabil untuk fungsi grafik beserta inputnya."""
+    digest = hashlib.sha256(f"{plot.__module__}.{plot.__qualname__}".encode())
+    for value in args:
+        _digest(value, digest)
+    return digest.hexdigest()
+
+
+class ChartRenderer:
+    """Cache LRU hasil render (PNG) yang dipakai bersama semua sesi.
+
+    Isi cache berupa Future, jadi dua sesi yang meminta grafik yang sama
+    secara bersamaan hanya me-render sekali.
+    """
+
+    def __init__(self, max_entries=64, max_workers=None, processes=None):
+        cpus = os.cpu_count() or 1
+        self.max_entries = max_entries
+        self.max_workers = max_workers or min(4, cpus)
+        self.processes = cpus > 1 if processes is None else processes
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+
+    def _new_pool(self):
+        if not self.processes:
+            return ThreadPoolExecutor(max_workers=self.max_workers)
+        # forkserver/spawn: jangan fork proses server Streamlit yang punya banyak thread
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def close(self):
+        """Hentikan pool worker; cache tidak bisa dipakai lagi setelah ini."""
+        self._pool.shutdown()
+
+    def _submit(self, plot, args):
+        """Ambil Future dari cache atau kirim render baru; pool ikut dikembalikan jika render baru."""
+        key = chart_key(plot, *args)
+        with self._lock:
+            future = self._cache.get(key)
+            if future is not None:
+                self._cache.move_to_end(key)
+                return key, future, None
+            pool = self._pool
+            future = pool.submit(render_png, plot, *args)
+            self._cache[key] = future
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return key, future, pool
+
+    def _replace_pool(self, broken):
+        """Ganti pool yang rusak (jika belum diganti sesi lain) dan buang render yang gagal karenanya."""
+        if self._pool is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool()
+        for key, future in list(self._cache.items()):
+            if future.done() and (future.cancelled() or future.exception() is not None):
+                del self._cache[key]
+
+    def render_all(self, jobs):
+        """Render semua `jobs` ({nama: (fungsi_grafik, *input)}) dan kembalikan {nama: PNG}."""
+        submitted = {name: self._submit(job[0], job[1:]) for name, job in jobs.items()}
+        images = {}
+        for name, (key, future, pool) in submitted.items():
+            try:
+                images[name] = future.result()
+            except Exception as error:
+                # Jangan simpan render yang gagal agar bisa dicoba lagi
+                with self._lock:
+                    if self._cache.get(key) is future:
+                        del self._cache[key]
+                    if isinstance(error, BrokenProcessPool) and pool is not None:
+                        self._replace_pool(pool)
+                raise
+        return images
@@ -0,0 +1,80 @@
+"""Skema data bersama untuk notebook dan dashboard.
+
+Kolom kode (musim, cuaca, jam, dst.) disimpan sebagai int8, ukuran cuaca/suhu
+sebagai float32 dan jumlah penyewaan sebagai int32. Label (Musim, Hari, Cuaca,
+Waktu) dibuat sebagai Categorical lewat tabel lookup, sekali saat data dimuat.
+"""
+import numpy as np
+import pandas as pd
+
+# Mapping label musim, hari dan cuaca
+SEASON_LABELS = {1: "Spring", 2: "Summer", 3: "Fall", 4: "Winter"}
+DAY_LABELS = {0: "Akhir Pekan", 1: "Hari Kerja"}
+WEATHER_LABELS = {1: "Cerah", 2: "Berawan", 3: "Hujan Ringan", 4: "Hujan Deras"}
+
+# Kategori waktu per jam: Pagi 06-09, Siang 10-13, Sore 14-17, sisanya Malam
+TIME_LABELS = ["Pagi", "Siang", "Sore", "Malam"]
+TIME_OF_DAY = np.array(["Malam"] * 6 + ["Pagi"] * 4 + ["Siang"] * 4 + ["Sore"] * 4 + ["Malam"] * 6)
+
+CODE_COLUMNS = ["season", "yr", "mnth", "holiday", "weekday", "workingday", "weathersit"]
+MEASURE_COLUMNS = ["temp", "atemp", "hum", "windspeed"]
+COUNT_COLUMNS = ["casual", "registered", "cnt"]
+
+
+def _dtypes():
+    dtypes = {"hr": "int8"}
+    for suffix in ("", "_x", "_y"):
+        dtypes.update({f"{c}{suffix}": "int8" for c in CODE_COLUMNS})
+        dtypes.update({f"{c}{suffix}": "float32" for c in MEASURE_COLUMNS})
+        dtypes.update({f"{c}{suffix}": "int32" for c in COUNT_COLUMNS})
+    return dtypes
+
+
+# Tipe kolom untuk day.csv, hour.csv maupun hasil join (akhiran _x/_y)
+DTYPES = _dtypes()
+
+
+def apply_schema(df):
+    """Ubah kolom yang dikenal ke tipe ringkas; kolom lain dibiarkan."""
+    return df.astype({c: t for c, t in DTYPES.items() if c in df.columns and df[c].dtype != t})
+
+
+def label_codes(labels, selected):
+    """Kode dari label yang dipilih, misal label_codes(SEASON_LABELS, ["Fall"]) -> [3]."""
+    return [code for code, label in labels.items() if label in selected]
+
+
+def lookup_categorical(codes, labels):
+    """Petakan array kode ke Categorical berlabel secara vektor (tanpa `.map`)."""
+    categories = list(labels.values())
+    table = np.full(max(labels) + 1, -1, dtype=np.int8)
+    table[list(labels)] = np.arange(len(labels))
+    return pd.Categorical.from_codes(table[np.asarray(codes)], categories)
+
+
+def time_of_day(hours):
+    """Kategori waktu (Pagi/Siang/Sore/Malam) untuk array jam 0-23."""
+    return pd.Categorical(TIME_OF_DAY[np.asarray(hours)], categories=TIME_LABELS)
+
+
+def add_features(df, date_column="dteday_x"):
+    """Tambahkan kolom turunan Musim, Hari, Cuaca, year, month dan Waktu.
+
+    Mengharapkan hasil join day/hour (kolom harian berakhiran `_x`).
+    """
+    dates = df[date_column].dt
+    features = {
+        "Musim": lookup_categorical(df["season_x"], SEASON_LABELS),
+        "Hari": lookup_categorical(df["workingday_x"], DAY_LABELS),
+        "Cuaca": lookup_categorical(df["weathersit_x"], WEATHER_LABELS),
+        "year": dates.year.astype("int16"),
+        "month": dates.month.astype("int8"),
+    }
+    if "hr" in df.columns:
+        features["Waktu"] = time_of_day(df["hr"])
+    return df.assign(**features)
+
+
+def prepare(df):
+    """Skema ringkas + kolom turunan; dipanggil sekali saat data dimuat."""
+    return add_features(apply_schema(df))
@@ -0,0 +1,77 @@
+"""Dataset read-only yang dibagi semua sesi Streamlit dalam satu proses.
+
+Dibangun sekali dari cube (lihat cube.py) dan disimpan lewat st.cache_resource,
+jadi tidak ada salinan per sesi. Semua array dikunci (read-only). Filter
+sidebar hanya menghasilkan array indeks tanggal; roll-up per sesi dihitung
+dari indeks itu tanpa menyalin atau mengubah data bersama.
+"""
+import numpy as np
+import pandas as pd
+
+from cube import DAY_KEYS, average_per_hour, daily_totals
+
+
+def _frozen(values):
+    values = np.ascontiguousarray(values)
+    values.setflags(write=False)
+    return values
+
+
+class SharedDataset:
+    """Total penyewaan per tanggal (beserta kode musim/hari/cuaca) dan per jam."""
+
+    def __init__(self, cube):
+        daily = daily_totals(cube).sort_values("dteday_x")
+        self.dates = _frozen(daily["dteday_x"].to_numpy())
+        self.season = _frozen(daily["season_x"].to_numpy())
+        self.workingday = _frozen(daily["workingday_x"].to_numpy())
+        self.weathersit = _frozen(daily["weathersit_x"].to_numpy())
+        self.cnt = _frozen(daily["cnt"].to_numpy(dtype=np.int64))
+
+        dates = pd.DatetimeIndex(self.dates)
+        self.year = _frozen(dates.year.to_numpy(dtype=np.int16))
+        self.month = _frozen(dates.month.to_numpy(dtype=np.int8))
+
+        hourly = cube.groupby("hr")[["cnt", "n"]].sum()
+        self.hour = _frozen(hourly.index.to_numpy())
+        self.hour_cnt = _frozen(hourly["cnt"].to_numpy(dtype=np.int64))
+        self.hour_n = _frozen(hourly["n"].to_numpy(dtype=np.int64))
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def date_range(self):
+        return pd.Timestamp(self.dates[0]), pd.Timestamp(self.dates[-1])
+
+    def select(self, start_date, end_date, seasons, workingdays, weathers):
+        """Indeks tanggal yang lolos filter; semua filter sidebar berlaku per tanggal."""
+        lo = np.searchsorted(self.dates, np.datetime64(start_date), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end_date), side="right")
+        mask = (
+            np.isin(self.season[lo:hi], seasons)
+            & np.isin(self.workingday[lo:hi], workingdays)
+            & np.isin(self.weathersit[lo:hi], weathers)
+        )
+        return np.flatnonzero(mask) + lo
+
+    def daily_totals(self, index):
+        """Total per tanggal untuk `index`, dengan kolom yang sama seperti cube.daily_totals."""
+        columns = (self.dates, self.season, self.workingday, self.weathersit, self.cnt)
+        return pd.DataFrame({key: values[index] for key, values in zip(DAY_KEYS + ["cnt"], columns)})
+
+    def monthly_trend(self, index):
+        """Total penyewaan per (year, month) untuk `index`."""
+        months = self.year[index].astype(np.int64) * 12 + self.month[index] - 1
+        keys, inverse = np.unique(months, return_inverse=True)
+        totals = np.bincount(inverse, weights=self.cnt[index], minlength=len(keys)).astype(np.int64)
+        return pd.DataFrame({"year": keys // 12, "month": keys % 12 + 1, "cnt": totals})
+
+    def average_per_hour(self, buckets=None):
+        """Rata-rata penyewaan per jam atau per kelompok jam, atas seluruh data.
+
+        Tidak mengikuti filter sidebar (sama seperti dashboard semula), jadi
+        tidak menerima indeks.
+        """
+        hourly = pd.DataFrame({"hr": self.hour, "cnt": self.hour_cnt, "n": self.hour_n})
+        return average_per_hour(hourly, buckets)
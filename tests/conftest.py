@@ -0,0 +1,77 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT_DIR, "data", "Bike-sharing-dataset")
+
+# Modul dashboard membaca BIKE_DATA_DIR/BIKE_CACHE_DIR saat di-import
+WORK_DIR = tempfile.mkdtemp(prefix="bike-tests-")
+DATA_DIR = os.path.join(WORK_DIR, "data")
+CACHE_DIR = os.path.join(WORK_DIR, "cache")
+os.environ["BIKE_DATA_DIR"] = DATA_DIR
+os.environ["BIKE_CACHE_DIR"] = CACHE_DIR
+sys.path.insert(0, os.path.join(ROOT_DIR, "dashboard"))
+
+# Riwayat uji: Januari 2011; drop diambil dari tanggal sesudahnya di data asli
+HISTORY_END = "2011-01-31"
+
+
+def _read_source():
+    day = pd.read_csv(os.path.join(SOURCE_DIR, "day.csv"), parse_dates=["dteday"])
+    hour = pd.read_csv(os.path.join(SOURCE_DIR, "hour.csv"), parse_dates=["dteday"])
+    return day, hour
+
+
+def write_pair(directory, day, hour):
+    """Tulis day.csv/hour.csv ke `directory`; kembalikan (path day, path hour)."""
+    os.makedirs(directory, exist_ok=True)
+    paths = os.path.join(directory, "day.csv"), os.path.join(directory, "hour.csv")
+    day.to_csv(paths[0], index=False, date_format="%Y-%m-%d")
+    hour.to_csv(paths[1], index=False, date_format="%Y-%m-%d")
+    return paths
+
+
+@pytest.fixture(scope="session")
+def source():
+    return _read_source()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def work_dir():
+    yield WORK_DIR
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def history(source):
+    """(day, hour) yang menjadi sumber store uji."""
+    day, hour = source
+    return day[day["dteday"] <= HISTORY_END], hour[hour["dteday"] <= HISTORY_END]
+
+
+@pytest.fixture(autouse=True)
+def store(history):
+    """Data sumber (Januari 2011) dan cache baru untuk setiap test."""
+    shutil.rmtree(DATA_DIR, ignore_errors=True)
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    write_pair(DATA_DIR, *history)
+
+
+@pytest.fixture
+def make_drop(source, tmp_path):
+    """Tulis drop berisi tanggal `start`..`end` dari data asli; kembalikan (path day, path hour)."""
+    day, hour = source
+
+    def make(start, end, name="drop", edit=None):
+        day_part = day[(day["dteday"] >= start) & (day["dteday"] <= end)].copy()
+        hour_part = hour[(hour["dteday"] >= start) & (hour["dteday"] <= end)].copy()
+        if edit is not None:
+            day_part, hour_part = edit(day_part, hour_part)
+        return write_pair(tmp_path / name, day_part, hour_part)
+
+    return make
@@ -0,0 +1,28 @@
+import pyarrow.dataset as ds
+
+import data_store
+from etl import COLUMNS, join_day_hour
+
+
+def test_join_matches_day_totals(source):
+    day, hour = source
+    all_data = join_day_hour(day, hour)
+
+    assert len(all_data) == len(hour) == 17379
+    assert list(all_data.columns) == COLUMNS
+    assert (all_data["dteday_x"] == all_data["dteday_y"]).all()
+    totals = all_data.groupby("dteday_x")[["casual_y", "registered_y", "cnt_y"]].sum()
+    expected = day.set_index("dteday")[["casual", "registered", "cnt"]]
+    assert len(totals) == len(day)
+    assert (totals.to_numpy() == expected.loc[totals.index].to_numpy()).all()
+
+
+def test_store_matches_sources(history):
+    day, hour = history
+    store = data_store.ensure_hourly_store()
+    table = ds.dataset(store, format="parquet", partitioning="hive").to_table().to_pandas()
+
+    assert len(table) == len(hour)
+    assert set(table["month"]) == {1}
+    assert table.groupby("dteday_x")["cnt_y"].sum().tolist() == day["cnt"].tolist()
+    assert data_store.load_cube()["cnt"].sum() == day["cnt"].sum()
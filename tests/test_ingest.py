@@ -0,0 +1,125 @@
+import os
+import shutil
+import threading
+
+import pandas as pd
+import pytest
+
+import data_store
+import ingest
+from cube import daily_totals
+from query import scan_days
+
+
+def stored_days():
+    return daily_totals(data_store.load_cube()).set_index("dteday_x")["cnt"].sort_index()
+
+
+def test_ingest_adds_only_new_dates(make_drop):
+    day_path, hour_path = make_drop("2011-01-31", "2011-02-10")
+    batch = ingest.ingest(day_path, hour_path)
+
+    assert batch["days"] == 10
+    assert batch["skipped_days"] == 1
+    days = stored_days()
+    assert days.index.max() == pd.Timestamp("2011-02-10")
+    assert len(days) == 41
+    assert len(scan_days(["dteday_x"])) == 41
+
+    again = ingest.ingest(day_path, hour_path)
+    assert again["days"] == 0
+    assert again["skipped_days"] == 11
+    assert len(stored_days()) == 41
+
+
+def test_cube_matches_day_csv_after_ingest(make_drop, source):
+    ingest.ingest(*make_drop("2011-02-01", "2011-02-05"))
+    day, _ = source
+    expected = day[day["dteday"] <= "2011-02-05"].set_index("dteday")["cnt"]
+    assert stored_days().to_numpy().tolist() == expected.to_numpy().tolist()
+
+
+def test_ingested_dates_survive_rebuild(make_drop):
+    ingest.ingest(*make_drop("2011-02-01", "2011-02-02"))
+    before = data_store.current_store()
+
+    # Ubah satu nilai di day.csv sumber: store harus dibangun ulang dengan drop diputar ulang
+    day = pd.read_csv(data_store.DAY_CSV)
+    day.loc[0, "temp"] += 0.01
+    day.to_csv(data_store.DAY_CSV, index=False)
+
+    store = data_store.ensure_hourly_store()
+    assert store != before
+    assert stored_days().index.max() == pd.Timestamp("2011-02-02")
+    assert len(stored_days()) == 33
+    meta = data_store.read_meta(os.path.join(store, data_store.MANIFEST_NAME))
+    assert len(meta["batches"]) == 1
+
+
+def test_ingested_dates_survive_cache_removal(make_drop):
+    ingest.ingest(*make_drop("2011-02-01", "2011-02-02"))
+    shutil.rmtree(data_store.CACHE_DIR)
+    assert len(stored_days()) == 33
+
+
+def test_crash_after_saving_drop_is_recovered(make_drop, monkeypatch):
+    def crash(*args):
+        raise RuntimeError("crash")
+
+    before = data_store.ensure_hourly_store()
+    monkeypatch.setattr(ingest, "write_batch", crash)
+    with pytest.raises(RuntimeError):
+        ingest.ingest(*make_drop("2011-02-01", "2011-02-03"))
+    monkeypatch.undo()
+    # Versi yang setengah jadi tidak pernah diaktifkan
+    assert data_store.current_store() == before
+
+    # Drop sudah tersimpan, jadi store berikutnya memutarnya ulang; ingest ulang tidak menggandakan
+    assert len(stored_days()) == 34
+    batch = ingest.ingest(*make_drop("2011-02-01", "2011-02-03"))
+    assert batch["days"] == 0
+    assert len(data_store.drop_dirs()) == 1
+    assert len(stored_days()) == 34
+
+
+def test_concurrent_ingest_adds_once(make_drop):
+    paths = make_drop("2011-02-01", "2011-02-04")
+    data_store.ensure_hourly_store()
+    batches = []
+    threads = [threading.Thread(target=lambda: batches.append(ingest.ingest(*paths))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(b["days"] for b in batches) == [0, 0, 4]
+    assert len(data_store.drop_dirs()) == 1
+    days = stored_days()
+    assert len(days) == 35
+    assert days.index.is_unique
+
+
+@pytest.mark.parametrize(
+    "edit, message",
+    [
+        (lambda d, h: (d.assign(season="x"), h), "bukan angka"),
+        (lambda d, h: (d, h.assign(hr=h["hr"] + 30)), "hr berisi kode"),
+        (lambda d, h: (d, pd.concat([h, h.head(1)])), "(dteday, hr) duplikat"),
+        (lambda d, h: (d.assign(cnt=d["cnt"] + 1), h), "cnt tidak sama"),
+        (lambda d, h: (d.drop(columns="temp"), h), "kolom hilang"),
+        (lambda d, h: (d.iloc[1:], h), "tanggal tidak ada di day"),
+        (lambda d, h: (d.assign(dteday="bukan tanggal"), h), "dteday bukan tanggal"),
+        (lambda d, h: (d.assign(dteday=d["dteday"].dt.strftime("%d/%m/%Y")), h), "dteday bukan tanggal"),
+        (lambda d, h: (d.assign(yr=1), h), "yr/mnth tidak sesuai"),
+        (lambda d, h: (d, h.assign(mnth=3)), "yr/mnth tidak sesuai"),
+        (lambda d, h: (d.assign(casual=d["casual"] + 1, cnt=d["cnt"] + 1), h), "tidak sama dengan jumlah per jam"),
+        (lambda d, h: (d.head(0), h.head(0)), "drop kosong"),
+        (lambda d, h: (d, h.head(0)), "hour: tidak ada baris data"),
+    ],
+)
+def test_invalid_drop_is_rejected(make_drop, edit, message):
+    before = stored_days()
+    with pytest.raises(ingest.ValidationError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        ingest.ingest(*make_drop("2011-02-01", "2011-02-03", edit=edit))
+    assert data_store.drop_dirs() == []
+    assert stored_days().equals(before)
@@ -0,0 +1,33 @@
+import pandas as pd
+
+import ingest
+from query import date_filter, days_filter, open_days, scan_days
+
+
+def test_date_range_prunes_year_partitions(make_drop):
+    ingest.ingest(*make_drop("2012-01-01", "2012-01-31"))
+    days = open_days()
+
+    fragments = list(days.get_fragments())
+    selected = list(days.get_fragments(filter=date_filter(pd.Timestamp("2012-01-03"), pd.Timestamp("2012-01-10"))))
+    assert len(fragments) == 2
+    assert len(selected) == 1
+    assert "year=2012" in selected[0].path
+
+
+def test_scan_days_matches_day_csv(make_drop, source):
+    ingest.ingest(*make_drop("2011-02-01", "2011-03-31"))
+    day, _ = source
+    selection = ("2011-01-15", "2011-03-10", [1], [0, 1], [1, 2])
+
+    rows = scan_days(["dteday_x", "temp_x", "cnt_x"], *selection).sort_values("dteday_x")
+    expected = day[
+        (day["dteday"] >= selection[0])
+        & (day["dteday"] <= selection[1])
+        & day["season"].isin(selection[2])
+        & day["workingday"].isin(selection[3])
+        & day["weathersit"].isin(selection[4])
+    ]
+    assert rows["dteday_x"].tolist() == expected["dteday"].tolist()
+    assert rows["cnt_x"].tolist() == expected["cnt"].tolist()
+    assert len(open_days().to_table(filter=days_filter(*selection))) == len(expected)
@@ -0,0 +1,81 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from matplotlib.figure import Figure
+
+from render import ChartRenderer
+
+# Fungsi grafik didefinisikan di level modul agar bisa dikirim ke process pool
+CALLS = []
+
+
+def bar_plot(value):
+    CALLS.append(value)
+    fig = Figure(figsize=(1, 1))
+    fig.subplots().bar([0], [value])
+    return fig
+
+
+def failing_plot(value):
+    CALLS.append(value)
+    if len(CALLS) == 1:
+        raise ValueError("render gagal")
+    return bar_plot(value)
+
+
+def crashing_plot(value):
+    os._exit(1)
+
+
+@pytest.fixture
+def renderer():
+    CALLS.clear()
+    renderer = ChartRenderer(max_entries=3, processes=False)
+    yield renderer
+    renderer.close()
+
+
+def test_cache_hit_returns_same_png(renderer):
+    first = renderer.render_all({"a": (bar_plot, 1)})
+    second = renderer.render_all({"a": (bar_plot, 1)})
+
+    assert first["a"].startswith(b"\x89PNG")
+    assert second == first
+    assert CALLS == [1]
+
+
+def test_cache_is_bounded_lru(renderer):
+    for value in range(5):
+        renderer.render_all({"a": (bar_plot, value)})
+    assert len(renderer) == 3
+
+    # 0 dan 1 sudah dikeluarkan; 4 masih ada di cache
+    renderer.render_all({"a": (bar_plot, 4), "b": (bar_plot, 0)})
+    assert CALLS == [0, 1, 2, 3, 4, 0]
+    assert len(renderer) == 3
+
+
+def test_failed_render_is_evicted_and_retried(renderer):
+    with pytest.raises(ValueError):
+        renderer.render_all({"a": (failing_plot, 1)})
+    assert len(renderer) == 0
+
+    images = renderer.render_all({"a": (failing_plot, 1)})
+    assert images["a"].startswith(b"\x89PNG")
+    assert len(renderer) == 1
+
+
+def test_broken_process_pool_is_replaced():
+    renderer = ChartRenderer(max_entries=3, max_workers=1, processes=True)
+    try:
+        broken = renderer._pool
+        with pytest.raises(BrokenProcessPool):
+            renderer.render_all({"a": (crashing_plot, 1)})
+        assert renderer._pool is not broken
+        assert len(renderer) == 0
+
+        images = renderer.render_all({"a": (bar_plot, 1)})
+        assert images["a"].startswith(b"\x89PNG")
+    finally:
+        renderer.close()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from cube import build_cube
+from etl import join_day_hour
+from schema import prepare
+from shared import SharedDataset
+
+SELECTION = ("2011-03-01", "2012-10-31", [2, 3], [1], [1, 2])
+
+
+@pytest.fixture(scope="module")
+def shared(source):
+    day, hour = source
+    return SharedDataset(build_cube(prepare(join_day_hour(day, hour))))
+
+
+@pytest.fixture
+def expected(source):
+    """Baris day.csv yang lolos SELECTION, dihitung langsung dengan pandas."""
+    day, _ = source
+    start, end, seasons, workingdays, weathers = SELECTION
+    return day[
+        (day["dteday"] >= start)
+        & (day["dteday"] <= end)
+        & day["season"].isin(seasons)
+        & day["workingday"].isin(workingdays)
+        & day["weathersit"].isin(weathers)
+    ]
+
+
+def test_select_matches_day_csv(shared, expected):
+    index = shared.select(*SELECTION)
+
+    assert len(shared) == 731
+    assert (shared.dates[index] == expected["dteday"].to_numpy()).all()
+
+
+def test_daily_totals_matches_day_csv(shared, expected):
+    daily = shared.daily_totals(shared.select(*SELECTION))
+
+    assert daily["cnt"].tolist() == expected["cnt"].tolist()
+    for column in ("season", "workingday", "weathersit"):
+        assert daily[f"{column}_x"].tolist() == expected[column].tolist()
+
+
+def test_monthly_trend_matches_day_csv(shared, expected):
+    trend = shared.monthly_trend(shared.select(*SELECTION))
+
+    grouped = expected.groupby([expected["dteday"].dt.year, expected["dteday"].dt.month])["cnt"].sum()
+    assert list(zip(trend["year"], trend["month"])) == grouped.index.tolist()
+    assert np.array_equal(trend["cnt"].to_numpy(), grouped.to_numpy())